@@ -0,0 +1,238 @@
+import pygame
+import random
+from array import array
+
+# Cell types (same as in grid.py)
+PRAIRIE = 1
+OTHER_PLANTS = 2
+
+# Cell states (same as in grid.py)
+DRY = 0
+BURNING = 2
+
+NO_CELL = -1
+
+class Crew:
+    """A crew of scripted firefighters acting together on one grid
+
+    Agents are plain ids. Positions, orders and the cell -> agent index all
+    live in flat arrays, so a step costs a few array reads per agent and no
+    objects are created per agent.
+
+    Each step the script fills in orders (move_to, wet_at, ignite_at; flat
+    cell indices or NO_CELL) and resolve() carries them out as one batch:
+    all moves first, then all wetting, then all ignition. Conflicts are
+    settled by agent id: a move only succeeds into a cell that was free at
+    the start of the step and not already claimed by a lower id. The
+    player's cell (passed to step() and escape_fire()) counts as occupied;
+    a crew member the player walked onto steps aside before orders run.
+    """
+    def __init__(self, grid, positions, script=None, seed=0):
+        self.grid = grid
+        self.topology = grid.topology
+        self.count = len(positions)
+        self.script = script or hold_the_line
+        self.random = random.Random(seed)
+
+        self.positions = array('i', (self.topology.index(row, col) for row, col in positions))
+        self.active = bytearray([1]) * self.count
+
+        # Spatial index: agent id standing on each cell, or NO_CELL
+        self.occupant = array('i', [NO_CELL]) * self.topology.size
+        for agent, cell in enumerate(self.positions):
+            if self.occupant[cell] != NO_CELL:
+                raise ValueError(f"Two crew members start on cell {self.topology.coords[cell]}")
+            self.occupant[cell] = agent
+
+        # Orders for the current step, reused every step
+        self.move_to = array('i', [NO_CELL]) * self.count
+        self.wet_at = array('i', [NO_CELL]) * self.count
+        self.ignite_at = array('i', [NO_CELL]) * self.count
+
+        # Cells claimed by a move this step, marked with the step number so
+        # the array never needs clearing
+        self.claimed = array('i', [-1]) * self.topology.size
+        self.step_number = 0
+
+        self.color = (255, 140, 0)  # Orange
+
+    @classmethod
+    def spawn(cls, grid, count, script=None, seed=0, avoid=None):
+        """Create a crew on distinct random walkable cells, leaving out the
+        avoid cell (the player's), if given"""
+        rng = random.Random(seed)
+        cells = [(row, col) for row, col in grid.topology.coords
+                 if grid.is_cell_walkable(row, col) and (row, col) != avoid]
+        positions = rng.sample(cells, min(count, len(cells)))
+        return cls(grid, positions, script, seed)
+
+    def active_count(self):
+        """Count crew members still on the grid"""
+        return sum(self.active)
+
+    def is_neighbour(self, cell, other):
+        """Check if other is adjacent to cell"""
+        indices = self.topology.indices
+        for k in range(self.topology.offsets[cell], self.topology.offsets[cell + 1]):
+            if indices[k] == other:
+                return True
+        return False
+
+    def step(self, player_cell=NO_CELL):
+        """Let the script give orders, then carry them out
+
+        player_cell is the flat index of the player's cell, or NO_CELL.
+        """
+        # The player moves first; a crew member they walked onto makes way
+        if player_cell != NO_CELL and self.occupant[player_cell] != NO_CELL:
+            self.relocate(self.occupant[player_cell], player_cell)
+
+        move_to, wet_at, ignite_at = self.move_to, self.wet_at, self.ignite_at
+        for agent in range(self.count):
+            move_to[agent] = NO_CELL
+            wet_at[agent] = NO_CELL
+            ignite_at[agent] = NO_CELL
+        self.script(self)
+        self.resolve(player_cell)
+
+    def resolve(self, player_cell=NO_CELL):
+        """Carry out this step's orders as one batch"""
+        self.step_number += 1
+        stamp = self.step_number
+        coords = self.topology.coords
+        cell_states = self.grid.cell_states
+        positions, active, occupant, claimed = self.positions, self.active, self.occupant, self.claimed
+
+        # Moves: into a free, walkable neighbour; lowest id wins a contested cell
+        move_to = self.move_to
+        for agent in range(self.count):
+            target = move_to[agent]
+            if target == NO_CELL:
+                continue
+            row, col = coords[target]
+            if (not active[agent] or target == player_cell or occupant[target] != NO_CELL or
+                    claimed[target] == stamp or cell_states[row][col] == BURNING or not self.is_neighbour(positions[agent], target)):
+                move_to[agent] = NO_CELL
+                continue
+            claimed[target] = stamp
+        # Targets were all free at the start of the step, so no winner can
+        # land on a cell another winner is just leaving
+        for agent in range(self.count):
+            target = move_to[agent]
+            if target != NO_CELL:
+                occupant[positions[agent]] = NO_CELL
+                occupant[target] = agent
+                positions[agent] = target
+
+        # Wetting, then ignition, on the agent's own cell or a neighbour
+        self.grid.add_water_cells(self.order_cells(self.wet_at))
+        self.grid.add_fire_cells(self.order_cells(self.ignite_at))
+
+    def order_cells(self, orders):
+        """Get the (row, col) targets of valid orders, in agent id order"""
+        coords, positions, active = self.topology.coords, self.positions, self.active
+        cells = []
+        for agent in range(self.count):
+            target = orders[agent]
+            if target == NO_CELL or not active[agent]:
+                continue
+            cell = positions[agent]
+            if target == cell or self.is_neighbour(cell, target):
+                cells.append(coords[target])
+        return cells
+
+    def escape_fire(self, player_cell=NO_CELL):
+        """Move crew members caught by spreading fire to a safe neighbour
+
+        Agents with nowhere to go are taken off the grid. Only the agents'
+        own cells are checked, so the cost is O(crew size) per step however
+        large the fire is.
+        """
+        coords, positions, active = self.topology.coords, self.positions, self.active
+        cell_states = self.grid.cell_states
+        for agent in range(self.count):
+            if not active[agent]:
+                continue
+            row, col = coords[positions[agent]]
+            if cell_states[row][col] == BURNING:
+                self.relocate(agent, player_cell)
+
+    def relocate(self, agent, player_cell=NO_CELL):
+        """Move an agent to its first free neighbour that isn't burning or
+        the player's cell, or take it off the grid if there is none"""
+        topology = self.topology
+        coords, offsets, indices = topology.coords, topology.offsets, topology.indices
+        cell_states = self.grid.cell_states
+        occupant = self.occupant
+        cell = self.positions[agent]
+        occupant[cell] = NO_CELL
+        for k in range(offsets[cell], offsets[cell + 1]):
+            n = indices[k]
+            new_row, new_col = coords[n]
+            if (n != player_cell and occupant[n] == NO_CELL and
+                    cell_states[new_row][new_col] != BURNING):
+                occupant[n] = agent
+                self.positions[agent] = n
+                return
+        self.active[agent] = 0
+
+    def draw(self):
+        """Draw crew members as small circles"""
+        radius = max(2, self.grid.cell_size // 4)
+        half = self.grid.cell_size // 2
+        for agent in range(self.count):
+            if self.active[agent]:
+                x, y = self.grid.cell_position(*self.topology.coords[self.positions[agent]])
+                pygame.draw.circle(self.grid.screen, self.color, (x + half, y + half), radius)
+
+def hold_the_line(crew):
+    """Wet plants next to the fire; otherwise wander
+
+    A crew member next to a burning cell wets a dry neighbour that isn't
+    prairie, so the fire can't reach the plants through it. Everyone else
+    steps to a random neighbour.
+    """
+    topology = crew.topology
+    coords, offsets, indices = topology.coords, topology.offsets, topology.indices
+    grid_data, cell_states = crew.grid.grid_data, crew.grid.cell_states
+    rng = crew.random
+    for agent in range(crew.count):
+        if not crew.active[agent]:
+            continue
+        cell = crew.positions[agent]
+        start, end = offsets[cell], offsets[cell + 1]
+        near_fire = False
+        protect = NO_CELL
+        for k in range(start, end):
+            n = indices[k]
+            row, col = coords[n]
+            state = cell_states[row][col]
+            if state == BURNING:
+                near_fire = True
+            elif state == DRY and grid_data[row][col] == OTHER_PLANTS and protect == NO_CELL:
+                protect = n
+        if near_fire and protect != NO_CELL:
+            crew.wet_at[agent] = protect
+        elif end > start:
+            crew.move_to[agent] = indices[rng.randrange(start, end)]
+
+def backburn(crew):
+    """Light dry prairie next to each crew member; otherwise wander"""
+    topology = crew.topology
+    coords, offsets, indices = topology.coords, topology.offsets, topology.indices
+    grid_data, cell_states = crew.grid.grid_data, crew.grid.cell_states
+    rng = crew.random
+    for agent in range(crew.count):
+        if not crew.active[agent]:
+            continue
+        cell = crew.positions[agent]
+        start, end = offsets[cell], offsets[cell + 1]
+        for k in range(start, end):
+            n = indices[k]
+            row, col = coords[n]
+            if grid_data[row][col] == PRAIRIE and cell_states[row][col] == DRY:
+                crew.ignite_at[agent] = n
+                break
+        else:
+            if end > start:
+                crew.move_to[agent] = indices[rng.randrange(start, end)]
@@ -33,8 +33,7 @@ class Fire:
         """Draw flame effects on burning cells"""
         for row, col in self.grid.burning_cells:
             # Calculate cell position
-            x = self.grid.grid_x + col * self.grid.cell_size
-            y = self.grid.grid_y + row * self.grid.cell_size
+            x, y = self.grid.cell_position(row, col)
             
             # Draw multiple flame rectangles with different colors
             for i in range(3):
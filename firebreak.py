@@ -0,0 +1,192 @@
+import sys
+import time
+from collections import deque
+
+from level import Level, EMPTY, PRAIRIE, OTHER_PLANTS
+from topology import Topology
+
+# Cell states (same as in grid.py)
+DRY = 0
+WET = 1
+BURNING = 2
+BURNED = 3
+
+INFINITE = 1 << 30
+
+class FlowNetwork:
+    """Directed graph with edge capacities, stored as linked edge lists
+
+    Edge e and its reverse edge e ^ 1 are always added together, so the
+    residual capacity of either is available without a lookup.
+    """
+    def __init__(self, node_count):
+        self.node_count = node_count
+        self.head = [-1] * node_count
+        self.to = []
+        self.cap = []
+        self.next = []
+
+    def add_edge(self, u, v, capacity):
+        self.to.append(v)
+        self.cap.append(capacity)
+        self.next.append(self.head[u])
+        self.head[u] = len(self.to) - 1
+        self.to.append(u)
+        self.cap.append(0)
+        self.next.append(self.head[v])
+        self.head[v] = len(self.to) - 1
+
+    def max_flow(self, source, sink):
+        """Push as much flow as possible from source to sink (Dinic's algorithm)"""
+        head, to, cap, nxt = self.head, self.to, self.cap, self.next
+        flow = 0
+        while True:
+            level = self.levels(source)
+            if level[sink] < 0:
+                return flow
+
+            # Find blocking flow with an iterative depth-first search
+            current = head[:]
+            path = []
+            u = source
+            while True:
+                if u == sink:
+                    pushed = min(cap[e] for e in path)
+                    for e in path:
+                        cap[e] -= pushed
+                        cap[e ^ 1] += pushed
+                    flow += pushed
+                    path = []
+                    u = source
+                    continue
+
+                e = current[u]
+                while e != -1 and (cap[e] == 0 or level[to[e]] != level[u] + 1):
+                    e = nxt[e]
+                current[u] = e
+                if e != -1:
+                    path.append(e)
+                    u = to[e]
+                    continue
+
+                # Dead end: never come back here this phase, and retreat
+                if u == source:
+                    break
+                level[u] = -1
+                e = path.pop()
+                u = to[e ^ 1]
+                current[u] = nxt[e]
+
+    def levels(self, source):
+        """Breadth-first distances from source over edges with capacity left"""
+        head, to, cap, nxt = self.head, self.to, self.cap, self.next
+        level = [-1] * self.node_count
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            e = head[u]
+            while e != -1:
+                if cap[e] > 0 and level[to[e]] < 0:
+                    level[to[e]] = level[u] + 1
+                    queue.append(to[e])
+                e = nxt[e]
+        return level
+
+def plan_firebreak(grid_data, topology, cell_states=None):
+    """Find a smallest set of cells to wet that keeps fire in the prairie away
+    from every other-plants cell
+
+    Each cell becomes an in-node and an out-node joined by an edge of
+    capacity 1 (wetting it), so the minimum cut of the network is a minimum
+    set of cells to wet. Only cells on the border between prairie and other
+    plants, plus empty cells, can lie on a shortest escape route for the
+    fire, so the interior of both regions is left out of the network.
+
+    Returns a list of (row, col) cells, or None if no firebreak is possible
+    (a cell on the border is already burning and can't be wet).
+    """
+    coords = topology.coords
+    offsets = topology.offsets
+    indices = topology.indices
+
+    # Flat copies so the scan below doesn't index rows
+    types = [cell_type for row in grid_data for cell_type in row]
+    if cell_states is None:
+        states = [DRY] * topology.size
+    else:
+        states = [state for row in cell_states for state in row]
+
+    # Pick out the cells fire could escape through. Wet and burned cells
+    # already stop fire, so they're left out.
+    node_of = {}
+    for i in range(topology.size):
+        if states[i] in (WET, BURNED):
+            continue
+        cell_type = types[i]
+        if cell_type != EMPTY:
+            for k in range(offsets[i], offsets[i + 1]):
+                if types[indices[k]] != cell_type:
+                    break
+            else:
+                continue  # Interior cell
+        node_of[i] = len(node_of)
+
+    # Nodes 2j and 2j + 1 are the in- and out-node of cell j
+    source = 2 * len(node_of)
+    sink = source + 1
+    network = FlowNetwork(sink + 1)
+    for i, j in node_of.items():
+        cell_type = types[i]
+        network.add_edge(2 * j, 2 * j + 1, INFINITE if states[i] == BURNING else 1)
+        if cell_type == PRAIRIE:
+            network.add_edge(source, 2 * j, INFINITE)
+        elif cell_type == OTHER_PLANTS:
+            # Fire only needs to reach an other-plants cell, not pass through it
+            network.add_edge(2 * j + 1, sink, INFINITE)
+            continue
+        for k in range(offsets[i], offsets[i + 1]):
+            n = indices[k]
+            if n in node_of and types[n] != PRAIRIE:
+                network.add_edge(2 * j + 1, 2 * node_of[n], INFINITE)
+
+    if network.max_flow(source, sink) >= INFINITE:
+        return None
+
+    # Cut cells have their in-node on the source side and out-node on the other
+    reachable = network.levels(source)
+    return [coords[i] for i, j in node_of.items()
+            if reachable[2 * j] >= 0 and reachable[2 * j + 1] < 0]
+
+def check_level(level):
+    """Plan a firebreak for a fresh level and compare it to the wet-square budget
+
+    Returns (cells, budget); cells is None if the level can't be protected.
+    """
+    topology = Topology(level.grid_size, level.grid_size, level.topology)
+    cells = plan_firebreak(level.grid_data, topology)
+    prairie_count = sum(row.count(PRAIRIE) for row in level.grid_data)
+    return cells, prairie_count // 2
+
+def main():
+    """Validate a range of levels: python firebreak.py [first_level] [last_level]"""
+    first = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    last = int(sys.argv[2]) if len(sys.argv) > 2 else first + 19
+    over_budget = 0
+    for level_number in range(first, last + 1):
+        start = time.perf_counter()
+        level = Level(level_number)
+        cells, budget = check_level(level)
+        elapsed = time.perf_counter() - start
+        if cells is not None and len(cells) <= budget:
+            result = "ok"
+        else:
+            result = "OVER BUDGET"
+            over_budget += 1
+        needed = "-" if cells is None else len(cells)
+        print(f"Level {level_number}: {level.grid_size}x{level.grid_size}, "
+              f"firebreak {needed} / budget {budget}, {result} ({elapsed:.2f}s)")
+    print(f"{over_budget} of {last - first + 1} levels need more wet squares than the setup budget")
+
+if __name__ == "__main__":
+    main()
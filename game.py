@@ -1,12 +1,26 @@
+import time
 import pygame
 from grid import Grid
 from player import Player
 from level import Level
 from fire import Fire
+from pathfinding import PathFinder
+from firebreak import plan_firebreak
+from crew import Crew
+from sim_clock import SimulationClock, MANUAL, AUTO, FAST_FORWARD
+
+# Drill crews get one firefighter per this many cells, up to MAX_CREW_SIZE
+CELLS_PER_CREW_MEMBER = 4
+MAX_CREW_SIZE = 200
+
+# Frames slower than this are logged as spikes when telemetry is on
+FRAME_SPIKE_SECONDS = 0.05
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, telemetry=None):
         self.screen = screen
+        # Optional TelemetryRecorder, kept across restarts
+        self.telemetry = telemetry
         self.level_number = 1
         self.load_level(self.level_number)
         self.time_step = 0
@@ -20,6 +34,25 @@ class Game:
         # Setup phase: how many wet squares can be placed
         self.wet_squares_left = self.grid.get_prairie_count() // 2
         
+        # Result of the last firebreak plan, shown during setup
+        self.plan_message = ""
+        
+        # Optional crew of scripted firefighters for training drills
+        self.crew = None
+        
+        # Simulation clock, separate from the render frame rate
+        self.sim_clock = SimulationClock()
+        
+        # Click-to-move: the player walks one cell per time step, paced by
+        # its own clock when the simulation clock isn't running
+        self.walk_target = None
+        self.walk_clock = SimulationClock(step_rate=10.0)
+        
+        # Telemetry timing
+        self.play_start_time = None
+        self.first_fire_step = None
+        self.last_frame_time = None
+        
     def load_level(self, level_number):
         # Load level data
         level_data = Level(level_number)
@@ -33,12 +66,43 @@ class Game:
         
         # Create fire manager
         self.fire = Fire(self.grid)
+        
+        # Shortest paths for click-to-move
+        self.pathfinder = PathFinder(self.grid)
+        
+        prairie_count = self.grid.get_prairie_count()
+        self.record("level_start", level=level_number, grid_size=self.grid_size,
+                    topology=self.grid.topology.kind, prairie=prairie_count,
+                    wet_budget=prairie_count // 2)
+    
+    def record(self, kind, **fields):
+        if self.telemetry:
+            self.telemetry.record(kind, **fields)
     
     def handle_event(self, event):
+        if self.telemetry and event.type == pygame.KEYDOWN:
+            self.record("key", key=event.key, phase=self.state, step=self.time_step)
+        elif self.telemetry and event.type == pygame.MOUSEBUTTONDOWN:
+            self.record("click", pos=list(event.pos), phase=self.state, step=self.time_step)
+            
         if self.game_over:
             # Restart game on any key press when game is over
             if event.type == pygame.KEYDOWN:
-                self.__init__(self.screen)
+                self.__init__(self.screen, self.telemetry)
+            return
+            
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            row, col = self.grid.screen_to_grid(*event.pos)
+            if row is None or col is None:
+                return
+            start = (self.player.row, self.player.col)
+            if not self.pathfinder.is_reachable(start, (row, col)):
+                return
+            if self.state == 0:
+                # No time passes during setup, so just walk straight there
+                self.player.row, self.player.col = row, col
+            else:
+                self.walk_target = (row, col)
             return
             
         if event.type == pygame.KEYDOWN:
@@ -46,6 +110,23 @@ class Game:
                 if event.key == pygame.K_SPACE and self.wet_squares_left == 0:
                     # Start playing when all wet squares are placed
                     self.state = 1
+                    self.play_start_time = time.perf_counter()
+                    self.record("play_start", wet_cells=len(self.grid.wet_cells))
+                    return
+                    
+                # Plan a firebreak and wet it automatically with P
+                if event.key == pygame.K_p:
+                    self.apply_firebreak_plan()
+                    return
+                    
+                # Add or remove a drill crew with C
+                if event.key == pygame.K_c:
+                    if self.crew is None:
+                        size = min(MAX_CREW_SIZE, self.grid.rows * self.grid.cols // CELLS_PER_CREW_MEMBER)
+                        self.crew = Crew.spawn(self.grid, size, seed=self.level_number,
+                                               avoid=(self.player.row, self.player.col))
+                    else:
+                        self.crew = None
                     return
                     
                 # During setup, arrow keys select cells
@@ -57,13 +138,32 @@ class Game:
                     if row is not None and col is not None:
                         if self.grid.add_water(row, col):
                             self.wet_squares_left -= 1
+                            self.plan_message = ""
+                            self.record("water", phase=self.state, step=self.time_step, cells=1)
                         
             elif self.state == 1:  # Playing phase
+                # Clock controls: A = let it burn, TAB = fast-forward, +/- = burn speed
+                if event.key == pygame.K_a:
+                    self.sim_clock.toggle_mode(AUTO)
+                    return
+                if event.key == pygame.K_TAB:
+                    self.sim_clock.toggle_mode(FAST_FORWARD)
+                    return
+                if event.key in [pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS]:
+                    self.sim_clock.change_step_rate(2.0)
+                    return
+                if event.key in [pygame.K_MINUS, pygame.K_KP_MINUS]:
+                    self.sim_clock.change_step_rate(0.5)
+                    return
+                
                 # Player movement - this happens BEFORE fire spreads
                 player_moved = False
                 
                 # For movement keys, check if the player would move into fire
                 if event.key in [pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT]:
+                    # Arrow keys take over from click-to-move
+                    self.walk_target = None
+                    
                     # First determine the new position
                     new_row, new_col = self.player.row, self.player.col
                     turn_only = pygame.key.get_mods() & pygame.KMOD_SHIFT
@@ -92,23 +192,84 @@ class Game:
                 if event.key == pygame.K_w:
                     row, col = self.player.get_adjacent_cell()
                     if row is not None and col is not None:
-                        self.grid.add_water(row, col)
+                        if self.grid.add_water(row, col):
+                            self.record("water", phase=self.state, step=self.time_step, cells=1)
                 
                 # Starting fire (F key)
                 if event.key == pygame.K_f:
                     row, col = self.player.get_adjacent_cell()
                     if row is not None and col is not None:
-                        self.fire.start_fire(row, col)
+                        if self.fire.start_fire(row, col) and self.first_fire_step is None:
+                            self.first_fire_step = self.time_step
+                            self.record("first_fire", step=self.time_step,
+                                        seconds=round(time.perf_counter() - self.play_start_time, 3))
                 
                 # Only update the time step if the player moved
                 if player_moved:
-                    self.time_step += 1
                     # Now update fire after player has moved
-                    self.update_time_step()
+                    self.advance_time_step()
+    
+    def apply_firebreak_plan(self):
+        cells = plan_firebreak(self.grid.grid_data, self.grid.topology, self.grid.cell_states)
+        if cells is None:
+            self.plan_message = "No firebreak can protect the other plants"
+        elif len(cells) > self.wet_squares_left:
+            self.plan_message = f"Firebreak needs {len(cells)} wet squares, only {self.wet_squares_left} left"
+        else:
+            placed = len(self.grid.add_water_cells(cells))
+            # The plan fills in the setup phase, so drop the unused budget
+            # and let SPACE start the burn straight away
+            unused = self.wet_squares_left - placed
+            self.wet_squares_left = 0
+            self.record("water", phase=self.state, step=self.time_step, cells=placed)
+            self.plan_message = (f"Firebreak placed: {placed} wet squares "
+                                 f"({unused} unused), SPACE to start")
+    
+    def advance_time_step(self):
+        # A click-to-move walk takes one cell per time step
+        if self.walk_target is not None:
+            next_cell = self.next_walk_cell()
+            if next_cell is None:
+                self.walk_target = None
+            else:
+                self.player.step_to(*next_cell)
+        
+        # The whole crew acts as one batch, before fire spreads like the player
+        if self.crew:
+            self.crew.step(self.grid.topology.index(self.player.row, self.player.col))
+        
+        self.time_step += 1
+        self.update_time_step()
+    
+    def next_walk_cell(self):
+        return self.pathfinder.next_step((self.player.row, self.player.col), self.walk_target)
+    
+    def should_stop_clock(self):
+        # Nothing left to watch once the game ends or the fire goes out
+        return self.game_over or self.fire.is_fire_out()
+    
+    def should_stop_walking(self):
+        # Stop once the target is reached or fire has cut off every path
+        if self.game_over or self.walk_target is None:
+            return True
+        if self.next_walk_cell() is None:
+            self.walk_target = None
+            return True
+        return False
     
     def update_time_step(self):
         # Update grid for this time step
+        front = len(self.grid.burning_cells)
+        step_start = time.perf_counter()
         self.grid.update_time_step()
+        if self.crew:
+            self.crew.escape_fire(self.grid.topology.index(self.player.row, self.player.col))
+        if self.telemetry:
+            self.record("step", step=self.time_step, burned=front,
+                        ignited=len(self.grid.burning_cells),
+                        unburned_prairie=self.grid.unburned_prairie,
+                        wet_cells=len(self.grid.wet_cells),
+                        step_ms=round((time.perf_counter() - step_start) * 1000, 3))
         
         # We no longer need to check if fire is adjacent to player here
         # Only check if player and fire occupy the same space during movement
@@ -120,8 +281,30 @@ class Game:
         elif self.grid.is_non_prairie_burned():
             self.game_over = True
             
+        if self.game_over:
+            self.record("level_end", level=self.level_number, victory=self.victory,
+                        steps=self.time_step, wet_squares_left=self.wet_squares_left)
+            
     def update(self):
-        pass  # Most updates happen in handle_event or time_step
+        now = time.perf_counter()
+        if self.telemetry and self.last_frame_time is not None:
+            frame_time = now - self.last_frame_time
+            if frame_time > FRAME_SPIKE_SECONDS:
+                self.record("frame_spike", step=self.time_step,
+                            frame_ms=round(frame_time * 1000, 1),
+                            front=len(self.grid.burning_cells))
+        self.last_frame_time = now
+        
+        # Input-driven steps happen in handle_event; the clock runs the rest
+        if self.state == 1 and not self.game_over:
+            if self.sim_clock.is_running():
+                # The running clock also carries any click-to-move walk along
+                self.sim_clock.update(self.advance_time_step, self.should_stop_clock)
+                self.walk_clock.set_mode(MANUAL)
+            elif self.walk_target is not None:
+                if not self.walk_clock.is_running():
+                    self.walk_clock.set_mode(AUTO)
+                self.walk_clock.update(self.advance_time_step, self.should_stop_walking)
         
     def draw(self):
         # Draw grid
@@ -130,7 +313,9 @@ class Game:
         # Draw fire effects
         self.fire.draw_flames()
         
-        # Draw player
+        # Draw crew and player
+        if self.crew:
+            self.crew.draw()
         self.player.draw()
         
         # Draw UI
@@ -145,15 +330,24 @@ class Game:
             text3 = "W to add water in the direction you face, SPACE to start"
             text_surface3 = self.font.render(text3, True, (255, 255, 255))
             self.screen.blit(text_surface3, (20, 100))
+            text4 = self.plan_message or "P to place a firebreak automatically, C for a drill crew"
+            text_surface4 = self.font.render(text4, True, (255, 255, 255))
+            self.screen.blit(text_surface4, (20, 140))
         else:
             # Playing phase
             text = f"Time Step: {self.time_step}"
+            if self.sim_clock.mode == AUTO:
+                text += f"  (burning at {self.sim_clock.step_rate:g} steps/s)"
+            elif self.sim_clock.mode == FAST_FORWARD:
+                text += "  (fast-forward)"
+            if self.crew:
+                text += f"  Crew: {self.crew.active_count()}/{self.crew.count}"
             text_surface = self.font.render(text, True, (255, 255, 255))
             self.screen.blit(text_surface, (20, 20))
             text2 = "Arrow keys to move (advances time), SHIFT+arrow to turn only"
             text_surface2 = self.font.render(text2, True, (255, 255, 255))
             self.screen.blit(text_surface2, (20, 60))
-            text3 = "W=water, F=fire in the direction you face"
+            text3 = "W=water, F=fire, A=let it burn, TAB=fast-forward, +/- speed"
             text_surface3 = self.font.render(text3, True, (255, 255, 255))
             self.screen.blit(text_surface3, (20, 100))
             
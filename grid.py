@@ -1,5 +1,6 @@
 import pygame
 import random
+from topology import Topology, HEX
 
 # Cell types
 EMPTY = 0
@@ -19,14 +20,20 @@ class Grid:
         self.cols = level_data.grid_size
         self.grid_data = level_data.grid_data
         
+        # Neighbour tables for this level's layout
+        self.topology = Topology(self.rows, self.cols, level_data.topology)
+        
+        # Hex rows are staggered, so the grid is half a cell wider
+        self.width_in_cells = self.cols + (0.5 if self.topology.kind == HEX else 0)
+        
         # Calculate cell size based on screen dimensions
         screen_width = screen.get_width()
         screen_height = screen.get_height()
-        self.cell_size = min((screen_width - 100) // self.cols, 
-                             (screen_height - 200) // self.rows)
+        self.cell_size = int(min((screen_width - 100) // self.width_in_cells, 
+                                 (screen_height - 200) // self.rows))
         
         # Initialize grid position to center it
-        self.grid_x = (screen_width - (self.cols * self.cell_size)) // 2
+        self.grid_x = int(screen_width - self.width_in_cells * self.cell_size) // 2
         self.grid_y = (screen_height - (self.rows * self.cell_size)) // 2 + 50
         
         # Initialize cell states (all dry initially)
@@ -37,6 +44,10 @@ class Grid:
         
         # Track burning cells for fire spread
         self.burning_cells = []
+        
+        # Win/loss bookkeeping, kept up to date as cells catch fire
+        self.unburned_prairie = self.get_prairie_count()
+        self.non_prairie_burned = False
 
     def get_prairie_count(self):
         """Count the number of prairie cells"""
@@ -73,11 +84,99 @@ class Grid:
         # Can only burn prairie that is dry
         if (self.grid_data[row][col] == PRAIRIE and 
             self.cell_states[row][col] == DRY):
-            self.cell_states[row][col] = BURNING
+            self.ignite_cell(row, col)
             self.burning_cells.append((row, col))
             return True
         return False
     
+    def add_water_cells(self, cells):
+        """Add water to many cells at once, using the same rules as add_water
+
+        cells is any iterable of (row, col), e.g. from mask_cells, line_cells
+        or rect_cells. Returns the cells that were wetted, each once.
+        """
+        rows, cols = self.rows, self.cols
+        cell_states = self.cell_states
+        wet_cells = self.wet_cells
+        wetted = []
+        seen = set()
+        for row, col in cells:
+            if not (0 <= row < rows and 0 <= col < cols) or (row, col) in seen:
+                continue
+            seen.add((row, col))
+            if cell_states[row][col] in (BURNING, BURNED):
+                continue
+            cell_states[row][col] = WET
+            wet_cells[(row, col)] = 0  # Start counting time steps
+            wetted.append((row, col))
+        return wetted
+    
+    def add_fire_cells(self, cells):
+        """Start fires in many cells at once, using the same rules as add_fire
+
+        Returns the cells that were set burning.
+        """
+        rows, cols = self.rows, self.cols
+        grid_data, cell_states = self.grid_data, self.cell_states
+        ignited = []
+        for row, col in cells:
+            # Only dry prairie catches, so a repeated cell can't ignite twice
+            if (0 <= row < rows and 0 <= col < cols and
+                grid_data[row][col] == PRAIRIE and cell_states[row][col] == DRY):
+                self.ignite_cell(row, col)
+                ignited.append((row, col))
+        self.burning_cells.extend(ignited)
+        return ignited
+    
+    def mask_cells(self, mask):
+        """Get the cells where a rows x cols boolean mask is true"""
+        return [(row, col)
+                for row, mask_row in enumerate(mask[:self.rows])
+                for col, selected in enumerate(mask_row[:self.cols]) if selected]
+    
+    def line_cells(self, start, end):
+        """Get the cells on a straight line between two cells, both included
+
+        Uses Bresenham's algorithm, so consecutive cells always touch at
+        least at a corner. Cells outside the grid are left out.
+        """
+        row, col = start
+        end_row, end_col = end
+        d_row, d_col = abs(end_row - row), -abs(end_col - col)
+        step_row = 1 if row < end_row else -1
+        step_col = 1 if col < end_col else -1
+        error = d_row + d_col
+        cells = []
+        while True:
+            if self.is_valid_cell(row, col):
+                cells.append((row, col))
+            if row == end_row and col == end_col:
+                return cells
+            double_error = 2 * error
+            if double_error >= d_col:
+                error += d_col
+                row += step_row
+            if double_error <= d_row:
+                error += d_row
+                col += step_col
+    
+    def rect_cells(self, corner, opposite_corner):
+        """Get the cells in a rectangle between two corners, both included"""
+        top, bottom = sorted((corner[0], opposite_corner[0]))
+        left, right = sorted((corner[1], opposite_corner[1]))
+        top, left = max(top, 0), max(left, 0)
+        bottom, right = min(bottom, self.rows - 1), min(right, self.cols - 1)
+        return [(row, col) for row in range(top, bottom + 1) for col in range(left, right + 1)]
+    
+    def ignite_cell(self, row, col):
+        """Set a cell burning and update the win/loss counters"""
+        self.cell_states[row][col] = BURNING
+        cell_type = self.grid_data[row][col]
+        if cell_type == PRAIRIE:
+            self.unburned_prairie -= 1
+        elif cell_type == OTHER_PLANTS:
+            self.non_prairie_burned = True
+    
     # In grid.py, update this method:
     def is_cell_walkable(self, row, col):
         """Check if player can walk on this cell"""
@@ -89,17 +188,14 @@ class Grid:
     
     def get_adjacent_cells(self, row, col):
         """Get all valid adjacent cells"""
-        adjacent = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row, new_col = row + dr, col + dc
-            if self.is_valid_cell(new_row, new_col):
-                adjacent.append((new_row, new_col))
-        return adjacent
+        return self.topology.neighbours(row, col)
     
     def is_fire_adjacent_to_player(self, player_row, player_col):
         """Check if fire is adjacent to player"""
-        adjacent_cells = self.get_adjacent_cells(player_row, player_col)
-        for row, col in adjacent_cells:
+        topology = self.topology
+        i = topology.index(player_row, player_col)
+        for k in range(topology.offsets[i], topology.offsets[i + 1]):
+            row, col = topology.coords[topology.indices[k]]
             if self.cell_states[row][col] == BURNING:
                 return True
         return False
@@ -126,24 +222,30 @@ class Grid:
         
         # Spread fire
         new_burning_cells = []
+        cell_states = self.cell_states
+        coords = self.topology.coords
+        offsets = self.topology.offsets
+        indices = self.topology.indices
+        cols = self.cols
+        candidates = []  # Reused scratch list of dry neighbours
         for row, col in self.burning_cells:
             # Each burning cell burns for exactly one turn
-            self.cell_states[row][col] = BURNED
+            cell_states[row][col] = BURNED
             
-            # Try to spread fire to adjacent cells
-            adjacent_cells = self.get_adjacent_cells(row, col)
-            random.shuffle(adjacent_cells)  # Randomize spread direction
+            # Fire can spread to any dry cell (prairie or other plants)
+            candidates.clear()
+            i = row * cols + col
+            for k in range(offsets[i], offsets[i + 1]):
+                new_row, new_col = coords[indices[k]]
+                if cell_states[new_row][new_col] == DRY:
+                    candidates.append((new_row, new_col))
             
-            # Keep trying until fire spreads to at least one cell
-            # or until we've tried all possible directions
-            spread_success = False
-            for new_row, new_col in adjacent_cells:
-                # Fire can spread to any dry cell (prairie or other plants)
-                if self.cell_states[new_row][new_col] == DRY:
-                    self.cell_states[new_row][new_col] = BURNING
-                    new_burning_cells.append((new_row, new_col))
-                    spread_success = True
-                    break  # Successfully spread to one cell
+            # Spread to one random dry neighbour (same odds as shuffling the
+            # neighbours and taking the first dry one)
+            if candidates:
+                new_row, new_col = random.choice(candidates)
+                self.ignite_cell(new_row, new_col)
+                new_burning_cells.append((new_row, new_col))
                     
             # If fire couldn't spread anywhere (surrounded by wet or burned cells),
             # it just goes out
@@ -153,29 +255,18 @@ class Grid:
 
     def is_all_prairie_burned(self):
         """Check if all prairie cells are burned"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if (self.grid_data[row][col] == PRAIRIE and 
-                    self.cell_states[row][col] not in [BURNED, BURNING]):
-                    return False
-        return True
+        return self.unburned_prairie == 0
     
     def is_non_prairie_burned(self):
         """Check if any non-prairie cell is burned"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if (self.grid_data[row][col] == OTHER_PLANTS and 
-                    self.cell_states[row][col] in [BURNED, BURNING]):
-                    return True
-        return False
+        return self.non_prairie_burned
     
     def draw(self):
         """Draw the grid"""
         for row in range(self.rows):
             for col in range(self.cols):
                 # Calculate cell position
-                x = self.grid_x + col * self.cell_size
-                y = self.grid_y + row * self.cell_size
+                x, y = self.cell_position(row, col)
                 
                 # Get cell type and state
                 cell_type = self.grid_data[row][col]
@@ -210,17 +301,25 @@ class Grid:
                 pygame.draw.rect(self.screen, (0, 0, 0), 
                                 (x, y, self.cell_size, self.cell_size), 1)
     
+    def cell_position(self, row, col):
+        """Get the screen position of a cell's top-left corner"""
+        x = self.grid_x + col * self.cell_size
+        if self.topology.kind == HEX and row % 2:
+            x += self.cell_size // 2  # Odd hex rows are shifted half a cell
+        return x, self.grid_y + row * self.cell_size
+    
     def screen_to_grid(self, screen_x, screen_y):
         """Convert screen coordinates to grid coordinates"""
-        # Check if within grid bounds
-        if (screen_x < self.grid_x or 
-            screen_y < self.grid_y or
-            screen_x >= self.grid_x + self.cols * self.cell_size or
+        # Check if within grid rows
+        if (screen_y < self.grid_y or
             screen_y >= self.grid_y + self.rows * self.cell_size):
             return None, None
             
         # Calculate grid coordinates
-        col = (screen_x - self.grid_x) // self.cell_size
         row = (screen_y - self.grid_y) // self.cell_size
+        row_x = self.cell_position(row, 0)[0]
+        if screen_x < row_x or screen_x >= row_x + self.cols * self.cell_size:
+            return None, None
+        col = (screen_x - row_x) // self.cell_size
         
         return row, col
\ No newline at end of file
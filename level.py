@@ -1,4 +1,5 @@
 import random
+from topology import SQUARE_4
 
 # Cell types
 EMPTY = 0
@@ -7,6 +8,10 @@ OTHER_PLANTS = 2
 
 class Level:
     def __init__(self, level_number):
+        # Neighbour layout for fire spread and movement; level builders
+        # may override it with SQUARE_8 or HEX
+        self.topology = SQUARE_4
+        
         # Initialize level based on level number
         if level_number == 1:
             self.create_level_1()
@@ -1,6 +1,8 @@
+import os
 import pygame
 import sys
 from game import Game
+from telemetry import TelemetryRecorder
 
 # Initialize pygame
 pygame.init()
@@ -18,8 +20,12 @@ BLACK = (0, 0, 0)
 clock = pygame.time.Clock()
 FPS = 30
 
+# Optional gameplay telemetry: set PRAIRIE_BURN_TELEMETRY to a log directory
+telemetry_dir = os.environ.get("PRAIRIE_BURN_TELEMETRY")
+telemetry = TelemetryRecorder(telemetry_dir) if telemetry_dir else None
+
 # Create game instance
-game = Game(screen)
+game = Game(screen, telemetry)
 
 # Main game loop
 def main():
@@ -49,6 +55,8 @@ def main():
         clock.tick(FPS)
 
     # Quit the game
+    if telemetry:
+        telemetry.close()
     pygame.quit()
     sys.exit()
 
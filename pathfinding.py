@@ -0,0 +1,191 @@
+import heapq
+from array import array
+from collections import deque
+
+# Cell states (same as in grid.py)
+BURNING = 2
+
+UNREACHABLE = 1 << 30
+
+class DistanceField:
+    """Walking distance from every cell to one target cell
+
+    Built once with a breadth-first search, then repaired in place when cells
+    start or stop burning, so only the part of the field that actually
+    changed is recomputed.
+    """
+    def __init__(self, grid, target):
+        self.grid = grid
+        self.topology = grid.topology
+        self.target = self.topology.index(*target)
+
+        # 1 where the player may stand, 0 where a cell is burning
+        self.walkable = bytearray(self.topology.size)
+        for i, (row, col) in enumerate(self.topology.coords):
+            if grid.cell_states[row][col] != BURNING:
+                self.walkable[i] = 1
+
+        self.dist = array('i', [UNREACHABLE]) * self.topology.size
+        self.build()
+
+    def build(self):
+        """Compute the field from scratch"""
+        dist = self.dist
+        walkable = self.walkable
+        offsets = self.topology.offsets
+        indices = self.topology.indices
+        if not walkable[self.target]:
+            return
+        dist[self.target] = 0
+        queue = deque([self.target])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for k in range(offsets[i], offsets[i + 1]):
+                n = indices[k]
+                if walkable[n] and dist[n] > d:
+                    dist[n] = d
+                    queue.append(n)
+
+    def distance(self, row, col):
+        """Get the number of steps from a cell to the target"""
+        return self.dist[self.topology.index(row, col)]
+
+    def update(self, blocked, opened):
+        """Repair the field after cells became unwalkable or walkable
+
+        blocked and opened are flat cell indices. Cells whose shortest path
+        ran through a blocked cell lose their distance and are re-seeded from
+        their intact neighbours; distances then flow outwards again from the
+        re-seeded and opened cells.
+        """
+        dist = self.dist
+        walkable = self.walkable
+        offsets = self.topology.offsets
+        indices = self.topology.indices
+        target = self.target
+
+        for i in blocked:
+            walkable[i] = 0
+        for i in opened:
+            walkable[i] = 1
+
+        # Find cells that lost every neighbour one step closer to the target.
+        # Cells are checked in order of their old distance, so by the time a
+        # cell is checked all possible supporters have already been decided.
+        orphans = set()
+        checked = set()
+        heap = [(dist[i], i) for i in blocked if dist[i] != UNREACHABLE]
+        heapq.heapify(heap)
+        while heap:
+            d, i = heapq.heappop(heap)
+            if i in checked:
+                continue
+            checked.add(i)
+            if walkable[i]:
+                if i == target:
+                    continue
+                supported = False
+                for k in range(offsets[i], offsets[i + 1]):
+                    n = indices[k]
+                    if dist[n] == d - 1 and n not in orphans:
+                        supported = True
+                        break
+                if supported:
+                    continue
+            orphans.add(i)
+            for k in range(offsets[i], offsets[i + 1]):
+                n = indices[k]
+                if dist[n] == d + 1 and n not in checked:
+                    heapq.heappush(heap, (d + 1, n))
+
+        for i in orphans:
+            dist[i] = UNREACHABLE
+
+        # Re-seed orphans and newly opened cells from their neighbours
+        heap = []
+        for i in list(orphans) + list(opened):
+            if not walkable[i]:
+                continue
+            best = 0 if i == target else UNREACHABLE
+            for k in range(offsets[i], offsets[i + 1]):
+                n = indices[k]
+                if dist[n] + 1 < best:
+                    best = dist[n] + 1
+            if best < dist[i]:
+                dist[i] = best
+                heap.append((best, i))
+        heapq.heapify(heap)
+
+        # Let the new distances flow outwards
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            d += 1
+            for k in range(offsets[i], offsets[i + 1]):
+                n = indices[k]
+                if walkable[n] and dist[n] > d:
+                    dist[n] = d
+                    heapq.heappush(heap, (d, n))
+
+class PathFinder:
+    """Shortest walkable paths for the player, with distance fields cached per target"""
+    def __init__(self, grid, max_fields=8):
+        self.grid = grid
+        self.max_fields = max_fields
+        self.fields = {}  # target index: DistanceField, oldest first
+        self.burning = set(grid.burning_cells)
+
+    def sync(self):
+        """Bring cached fields up to date with the cells burning right now"""
+        burning = set(self.grid.burning_cells)
+        if burning == self.burning:
+            return
+        # Only burning cells are unwalkable, so the change in the burning set
+        # is exactly the change in walkability
+        index = self.grid.topology.index
+        blocked = [index(row, col) for row, col in burning - self.burning]
+        opened = [index(row, col) for row, col in self.burning - burning]
+        self.burning = burning
+        for field in self.fields.values():
+            field.update(blocked, opened)
+
+    def get_field(self, target):
+        """Get the distance field for a target cell, building it if needed"""
+        self.sync()
+        key = self.grid.topology.index(*target)
+        field = self.fields.pop(key, None)
+        if field is None:
+            field = DistanceField(self.grid, target)
+            if len(self.fields) >= self.max_fields:
+                # Drop the least recently used field
+                del self.fields[next(iter(self.fields))]
+        self.fields[key] = field
+        return field
+
+    def is_reachable(self, start, target):
+        """Check if a walkable path exists from start to target"""
+        return self.get_field(target).distance(*start) != UNREACHABLE
+
+    def next_step(self, start, target):
+        """Get the next cell on a shortest path from start to target
+
+        Returns None if the player is already there or no path exists.
+        """
+        field = self.get_field(target)
+        topology = self.grid.topology
+        dist = field.dist
+        i = topology.index(*start)
+        best = dist[i]
+        if best == 0 or best == UNREACHABLE:
+            return None
+        step = None
+        for k in range(topology.offsets[i], topology.offsets[i + 1]):
+            n = topology.indices[k]
+            if dist[n] < best:
+                best = dist[n]
+                step = n
+        if step is None:
+            return None
+        return topology.coords[step]
@@ -30,8 +30,9 @@ class Player:
     def draw(self):
         """Draw the player on the grid"""
         # Calculate player position (centered in cell)
-        x = self.grid.grid_x + self.col * self.grid.cell_size + (self.grid.cell_size - self.size) // 2
-        y = self.grid.grid_y + self.row * self.grid.cell_size + (self.grid.cell_size - self.size) // 2
+        cell_x, cell_y = self.grid.cell_position(self.row, self.col)
+        x = cell_x + (self.grid.cell_size - self.size) // 2
+        y = cell_y + (self.grid.cell_size - self.size) // 2
         
         # Draw player
         pygame.draw.rect(self.grid.screen, self.color, (x, y, self.size, self.size))
@@ -92,6 +93,18 @@ class Player:
             
         return False  # Movement failed
     
+    def step_to(self, row, col):
+        """Move to a neighbouring cell, facing the direction of travel"""
+        if row < self.row:
+            self.direction = 0
+        elif row > self.row:
+            self.direction = 2
+        elif col > self.col:
+            self.direction = 1
+        elif col < self.col:
+            self.direction = 3
+        self.row, self.col = row, col
+    
     def get_adjacent_cell(self, event=None):
         """Get cell coordinates adjacent to player based on facing direction"""
         row, col = self.row, self.col
@@ -126,10 +139,11 @@ class Player:
         adjacent_cells = []
         
         # Find all safe adjacent cells
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row, new_col = self.row + dr, self.col + dc
-            if (self.grid.is_valid_cell(new_row, new_col) and 
-                self.grid.is_cell_walkable(new_row, new_col)):
+        topology = self.grid.topology
+        i = topology.index(self.row, self.col)
+        for k in range(topology.offsets[i], topology.offsets[i + 1]):
+            new_row, new_col = topology.coords[topology.indices[k]]
+            if self.grid.is_cell_walkable(new_row, new_col):
                 adjacent_cells.append((new_row, new_col))
                 
         # If there are safe cells, move to one
@@ -0,0 +1,80 @@
+import time
+
+# Clock modes
+MANUAL = 0        # Time only advances when the player moves
+AUTO = 1          # "Let it burn": advance at a fixed step rate
+FAST_FORWARD = 2  # Advance as many steps as the frame budget allows
+
+class SimulationClock:
+    def __init__(self, step_rate=5.0, frame_budget=0.012, max_catch_up=5):
+        self.mode = MANUAL
+        self.step_rate = step_rate          # Steps per second in AUTO mode
+        self.frame_budget = frame_budget    # Seconds per frame spent stepping in FAST_FORWARD
+        self.max_catch_up = max_catch_up    # Cap on AUTO steps run in a single frame
+
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def set_mode(self, mode):
+        """Switch clock mode and reset the fixed-timestep accumulator"""
+        self.mode = mode
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def toggle_mode(self, mode):
+        """Turn the given mode on, or back to MANUAL if it is already on"""
+        if self.mode == mode:
+            self.set_mode(MANUAL)
+        else:
+            self.set_mode(mode)
+
+    def change_step_rate(self, factor, min_rate=0.5, max_rate=120.0):
+        """Scale the AUTO step rate, clamped to a sane range"""
+        self.step_rate = max(min_rate, min(max_rate, self.step_rate * factor))
+
+    def is_running(self):
+        """Check if the clock advances time on its own"""
+        return self.mode != MANUAL
+
+    def update(self, step, should_stop):
+        """Run simulation steps for this frame and return how many were run
+
+        step() advances the simulation by one time step. should_stop() is
+        checked before every step, so the clock drops back to MANUAL as soon
+        as there is nothing left to simulate.
+        """
+        if self.mode == MANUAL:
+            return 0
+
+        now = time.perf_counter()
+        if self.last_time is None:
+            self.last_time = now
+        elapsed = now - self.last_time
+        self.last_time = now
+
+        steps = 0
+        if self.mode == AUTO:
+            # Fixed timestep: bank real time and spend it in whole steps
+            step_time = 1.0 / self.step_rate
+            self.accumulator += elapsed
+            while self.accumulator >= step_time and steps < self.max_catch_up:
+                if should_stop():
+                    self.set_mode(MANUAL)
+                    return steps
+                step()
+                steps += 1
+                self.accumulator -= step_time
+            # Don't let a long stall turn into a burst of catch-up steps later
+            if steps == self.max_catch_up:
+                self.accumulator = 0.0
+        else:  # FAST_FORWARD
+            deadline = now + self.frame_budget
+            while True:
+                if should_stop():
+                    self.set_mode(MANUAL)
+                    return steps
+                step()
+                steps += 1
+                if time.perf_counter() >= deadline:
+                    break
+        return steps
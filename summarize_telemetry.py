@@ -0,0 +1,126 @@
+import glob
+import json
+import os
+import sys
+
+def load_records(paths):
+    """Read records from telemetry files or directories of them"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.jsonl"))))
+        else:
+            files.append(path)
+
+    records = []
+    for file_path in files:
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass  # Last line of a file cut off by a crash
+    records.sort(key=lambda record: (record["session"], record["seq"]))
+    return records, len(files)
+
+def mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+def correlation(xs, ys):
+    """Pearson correlation, or 0 if either series is constant"""
+    if len(xs) < 2:
+        return 0.0
+    mean_x, mean_y = mean(xs), mean(ys)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    if var_x == 0 or var_y == 0:
+        return 0.0
+    return cov / (var_x * var_y) ** 0.5
+
+def summarize(records):
+    """Aggregate records from many sessions into per-level statistics"""
+    sessions = set()
+    levels = {}  # level number: stats
+    burned_per_step = []
+    step_ms = []
+    spike_ms = []
+    spike_front = []
+    dropped = 0
+
+    current = {}  # session: stats of the level being played
+    for record in records:
+        session = record["session"]
+        sessions.add(session)
+        kind = record["kind"]
+        if kind == "level_start":
+            stats = levels.setdefault(record["level"], {
+                "played": 0, "won": 0, "lost": 0, "steps": [], "wet_used": [],
+                "first_fire_steps": [], "first_fire_seconds": [],
+            })
+            stats["played"] += 1
+            current[session] = {"stats": stats, "wet_used": 0}
+        elif kind == "step":
+            burned_per_step.append(record["burned"])
+            step_ms.append(record["step_ms"])
+        elif kind == "frame_spike":
+            spike_ms.append(record["frame_ms"])
+            spike_front.append(record["front"])
+        elif kind == "session_end":
+            dropped += record.get("dropped", 0)
+        elif session not in current:
+            continue  # Between levels, or the level started in a rotated-out file
+        elif kind == "water":
+            current[session]["wet_used"] += record["cells"]
+        elif kind == "first_fire":
+            current[session]["stats"]["first_fire_steps"].append(record["step"])
+            current[session]["stats"]["first_fire_seconds"].append(record["seconds"])
+        elif kind == "level_end":
+            level = current.pop(session)
+            stats = level["stats"]
+            stats["won" if record["victory"] else "lost"] += 1
+            stats["steps"].append(record["steps"])
+            stats["wet_used"].append(level["wet_used"])
+
+    return {
+        "sessions": len(sessions),
+        "levels": levels,
+        "burned_per_step": mean(burned_per_step),
+        "max_burned_per_step": max(burned_per_step, default=0),
+        "step_ms": mean(step_ms),
+        "spikes": len(spike_ms),
+        "spike_ms": mean(spike_ms),
+        "spike_front_correlation": correlation(spike_front, spike_ms),
+        "dropped": dropped,
+    }
+
+def main():
+    """Summarise telemetry: python summarize_telemetry.py FILE_OR_DIR [...]"""
+    if len(sys.argv) < 2:
+        print("Usage: python summarize_telemetry.py FILE_OR_DIR [FILE_OR_DIR ...]")
+        sys.exit(1)
+
+    records, file_count = load_records(sys.argv[1:])
+    summary = summarize(records)
+
+    print(f"{len(records)} records from {file_count} files, {summary['sessions']} sessions "
+          f"({summary['dropped']} records dropped)")
+    print()
+    print("Level  Played  Won  Lost  Avg steps  Avg wet used  First fire (steps / s)")
+    for level_number in sorted(summary["levels"]):
+        stats = summary["levels"][level_number]
+        print(f"{level_number:>5}  {stats['played']:>6}  {stats['won']:>3}  {stats['lost']:>4}  "
+              f"{mean(stats['steps']):>9.1f}  {mean(stats['wet_used']):>12.1f}  "
+              f"{mean(stats['first_fire_steps']):>6.1f} / {mean(stats['first_fire_seconds']):.1f}")
+    print()
+    print(f"Cells burned per step: {summary['burned_per_step']:.2f} avg, "
+          f"{summary['max_burned_per_step']} max")
+    print(f"Simulation step time: {summary['step_ms']:.3f} ms avg")
+    print(f"Frame spikes: {summary['spikes']}, {summary['spike_ms']:.1f} ms avg, "
+          f"correlation with fire front size {summary['spike_front_correlation']:.2f}")
+
+if __name__ == "__main__":
+    main()
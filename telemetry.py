@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+class TelemetryRecorder:
+    """Collects gameplay records in memory and writes them out in the background
+
+    record() only appends to a bounded ring buffer, so the game loop never
+    waits on disk. A writer thread drains the buffer in batches into JSONL
+    files that rotate once they grow past max_file_bytes. If the writer falls
+    behind, the oldest unwritten records are dropped and counted.
+    """
+    def __init__(self, directory, buffer_size=50000, batch_size=1000,
+                 flush_interval=1.0, max_file_bytes=5_000_000, max_files=20):
+        self.directory = directory
+        self.session_id = uuid.uuid4().hex[:12]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+
+        self.buffer = deque(maxlen=buffer_size)
+        self.dropped = 0
+        self.sequence = 0
+        self.start_time = time.perf_counter()
+
+        self.file = None
+        self.file_number = 0
+        self.file_paths = []
+
+        os.makedirs(directory, exist_ok=True)
+        self.wake = threading.Event()
+        self.stopping = False
+        self.writer = threading.Thread(target=self.run_writer, name="telemetry-writer", daemon=True)
+        self.writer.start()
+
+    def record(self, kind, **fields):
+        """Queue a record; never blocks"""
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        fields["kind"] = kind
+        fields["session"] = self.session_id
+        fields["seq"] = self.sequence
+        fields["t"] = round(time.perf_counter() - self.start_time, 4)
+        self.sequence += 1
+        self.buffer.append(fields)
+        if len(self.buffer) >= self.batch_size:
+            self.wake.set()
+
+    def close(self):
+        """Write out everything still buffered and stop the writer thread"""
+        self.record("session_end", dropped=self.dropped)
+        self.stopping = True
+        self.wake.set()
+        self.writer.join()
+
+    def run_writer(self):
+        while True:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+            if self.stopping:
+                self.flush()
+                if self.file:
+                    self.file.close()
+                return
+
+    def flush(self):
+        """Drain the ring buffer to disk in batches"""
+        while self.buffer:
+            lines = []
+            while self.buffer and len(lines) < self.batch_size:
+                lines.append(json.dumps(self.buffer.popleft(), separators=(",", ":")))
+            self.write_batch("\n".join(lines) + "\n")
+
+    def write_batch(self, text):
+        if self.file is None or self.file.tell() >= self.max_file_bytes:
+            self.rotate()
+        self.file.write(text)
+        self.file.flush()
+
+    def rotate(self):
+        """Start a new file, deleting the oldest once there are too many"""
+        if self.file:
+            self.file.close()
+        self.file_number += 1
+        path = os.path.join(self.directory, f"session-{self.session_id}-{self.file_number:03d}.jsonl")
+        self.file = open(path, "w", encoding="utf-8")
+        self.file_paths.append(path)
+        while len(self.file_paths) > self.max_files:
+            os.remove(self.file_paths.pop(0))
@@ -0,0 +1,55 @@
+from array import array
+
+# Grid topologies
+SQUARE_4 = 0  # Up, down, left, right
+SQUARE_8 = 1  # Also the four diagonals
+HEX = 2       # Hexagons in "odd-r" layout: odd rows are shifted half a cell right
+
+NEIGHBOUR_OFFSETS = {
+    SQUARE_4: ([(-1, 0), (1, 0), (0, -1), (0, 1)],) * 2,
+    SQUARE_8: ([(-1, -1), (-1, 0), (-1, 1), (0, -1),
+                (0, 1), (1, -1), (1, 0), (1, 1)],) * 2,
+    # (even rows, odd rows)
+    HEX: ([(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],
+          [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]),
+}
+
+class Topology:
+    """Neighbour table for a grid, precomputed once per level
+
+    Cells are addressed by flat index (row * cols + col). The neighbours of
+    cell i are indices[offsets[i]:offsets[i + 1]] (CSR layout), so hot loops
+    can walk them with a range instead of building lists.
+    """
+    def __init__(self, rows, cols, kind=SQUARE_4):
+        if kind not in NEIGHBOUR_OFFSETS:
+            raise ValueError(f"Unknown topology: {kind}")
+        self.rows = rows
+        self.cols = cols
+        self.kind = kind
+        self.size = rows * cols
+
+        # Flat index -> (row, col), so callers never have to divmod
+        self.coords = [(row, col) for row in range(rows) for col in range(cols)]
+
+        self.offsets = array('i', [0])
+        self.indices = array('i')
+        even_offsets, odd_offsets = NEIGHBOUR_OFFSETS[kind]
+        for row in range(rows):
+            row_offsets = odd_offsets if row % 2 else even_offsets
+            for col in range(cols):
+                for dr, dc in row_offsets:
+                    new_row, new_col = row + dr, col + dc
+                    if 0 <= new_row < rows and 0 <= new_col < cols:
+                        self.indices.append(new_row * cols + new_col)
+                self.offsets.append(len(self.indices))
+
+    def index(self, row, col):
+        """Convert grid coordinates to a flat cell index"""
+        return row * self.cols + col
+
+    def neighbours(self, row, col):
+        """Get (row, col) of all neighbours of a cell"""
+        i = row * self.cols + col
+        coords = self.coords
+        return [coords[n] for n in self.indices[self.offsets[i]:self.offsets[i + 1]]]